@@ -0,0 +1,141 @@
+"""Compare per-update cost of fresh vs prebuilt keyboards/texts.
+
+Usage: python bench_render.py [updates]
+"""
+import sys
+import timeit
+import tracemalloc
+from datetime import date
+
+import kodlar
+
+
+def render_update(r, price, sub_days):
+    """Render everything the handlers send; results are returned so they can be kept alive."""
+    return (
+        r["main_menu"](True),
+        r["main_menu"](False),
+        r["admin_menu"](),
+        r["channel_link_keyboard"](),
+        r["start_active_text"]("Ali Valiyev", date(2026, 1, 31), 12),
+        r["start_inactive_text"](price),
+        r["registered_text"](price),
+        r["contact_text"](price),
+        r["buy_text"](price),
+        r["approved_text"](sub_days),
+        r["status_text"]("active"),
+    )
+
+
+def _fresh_start_active_text(fullname, expiry, days_left):
+    # What start() did before: one f-string per request
+    return (
+        f"? <b>Xush kelibsiz, {fullname}!</b>"
+        f"?? <b>Obuna ma'lumotlari:</b>"
+        f"? Status: ? Aktiv"
+        f"? Muddat: {expiry.strftime('%d.%m.%Y')} gacha"
+        f"? {days_left} kun qoldi"
+    )
+
+
+def _cached_start_active_text(fullname, expiry, days_left):
+    return kodlar.START_ACTIVE_TEXT.format(
+        fullname=fullname,
+        expiry=expiry.strftime('%d.%m.%Y'),
+        days_left=days_left,
+    )
+
+
+def _fresh_status_text(status):
+    # What profile() did before: rebuild the labels dict on every request
+    status_text = {
+        "active": "Aktiv",
+        "inactive": "Aktiv emas",
+        "expired": "Tugagan",
+        "banned": "Bloklangan"
+    }
+    return status_text.get(status, "Nomalum")
+
+
+FRESH = {
+    "main_menu": kodlar._main_menu.__wrapped__,
+    "admin_menu": kodlar.admin_menu.__wrapped__,
+    "channel_link_keyboard": lambda: kodlar._channel_link_keyboard.__wrapped__(kodlar.config.CHANNEL_INVITE_LINK),
+    "start_active_text": _fresh_start_active_text,
+    "start_inactive_text": kodlar.start_inactive_text.__wrapped__,
+    "registered_text": kodlar.registered_text.__wrapped__,
+    "contact_text": kodlar.contact_text.__wrapped__,
+    "buy_text": kodlar.buy_text.__wrapped__,
+    "approved_text": kodlar.approved_text.__wrapped__,
+    "status_text": _fresh_status_text,
+}
+
+CACHED = {
+    "main_menu": kodlar.main_menu,
+    "admin_menu": kodlar.admin_menu,
+    "channel_link_keyboard": kodlar.channel_link_keyboard,
+    "start_active_text": _cached_start_active_text,
+    "start_inactive_text": kodlar.start_inactive_text,
+    "registered_text": kodlar.registered_text,
+    "contact_text": kodlar.contact_text,
+    "buy_text": kodlar.buy_text,
+    "approved_text": kodlar.approved_text,
+    "status_text": lambda status: kodlar.STATUS_TEXT.get(status, "Nomalum"),
+}
+
+
+def fresh_update(price):
+    return render_update(FRESH, price, kodlar.config.SUB_DAYS)
+
+
+def cached_update(price):
+    return render_update(CACHED, price, kodlar.config.SUB_DAYS)
+
+
+def measure(update, updates, price=30000):
+    """Return (retained bytes, new blocks, peak bytes) per update.
+
+    Results of every update are kept alive, so the first two figures are
+    the memory and allocation count the rendering actually leaves behind.
+    The peak is the largest transient overhead seen while rendering one
+    update and is reported separately.
+    """
+    update(price)  # warm up caches and imports
+    results = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start, _ = tracemalloc.get_traced_memory()
+    for _ in range(updates):
+        results.append(update(price))
+    current, _ = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    peak_total = 0
+    for _ in range(updates):
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        update(price)
+        _, peak = tracemalloc.get_traced_memory()
+        peak_total += peak - base
+    tracemalloc.stop()
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    after, before = after.filter_traces(ignore), before.filter_traces(ignore)
+    new_blocks = sum(
+        stat.count_diff for stat in after.compare_to(before, "lineno") if stat.count_diff > 0
+    )
+    del results
+    return (current - start) / updates, new_blocks / updates, peak_total / updates
+
+
+def main():
+    updates = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    for name, update in (("fresh", fresh_update), ("cached", cached_update)):
+        retained, blocks, peak = measure(update, updates)
+        seconds = timeit.timeit(lambda: update(30000), number=updates)
+        print(
+            f"{name:>6}: {retained:.1f} B/update retained, {blocks:.1f} blocks/update, "
+            f"{peak:.1f} B peak, {seconds / updates * 1e6:.1f} us/update"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ import logging
 import aiosqlite
 from datetime import datetime, timedelta, date
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List
 import pytz
 
@@ -140,36 +141,119 @@ async def get_price():
         return row[0] if row else 30000
 
 # ================= KEYBOARDS =================
+# Each keyboard variant is built once and the same instance is returned to
+# every caller. The frozen subclasses below reject attribute assignment on the
+# shared markups and buttons; the row lists themselves must not be mutated.
+# Builders that depend on config take the relevant values as arguments, so
+# changing config picks a fresh cache entry.
+class FrozenReplyKeyboardMarkup(ReplyKeyboardMarkup):
+    model_config = {**ReplyKeyboardMarkup.model_config, "frozen": True}
+
+class FrozenKeyboardButton(KeyboardButton):
+    model_config = {**KeyboardButton.model_config, "frozen": True}
+
+class FrozenInlineKeyboardMarkup(InlineKeyboardMarkup):
+    model_config = {**InlineKeyboardMarkup.model_config, "frozen": True}
+
+class FrozenInlineKeyboardButton(InlineKeyboardButton):
+    model_config = {**InlineKeyboardButton.model_config, "frozen": True}
+
 def main_menu(active=False):
+    return _main_menu(bool(active))
+
+@lru_cache(maxsize=2)
+def _main_menu(active):
     buttons = []
     if active:
-        buttons.append([KeyboardButton(text="👤 Profil")])
-        buttons.append([KeyboardButton(text="🔗 Kanal linki")])
+        buttons.append([FrozenKeyboardButton(text="👤 Profil")])
+        buttons.append([FrozenKeyboardButton(text="🔗 Kanal linki")])
     else:
-        buttons.append([KeyboardButton(text="💳 Obuna sotib olish")])
-        buttons.append([KeyboardButton(text="📱 Telefon yuborish", request_contact=True)])
-    buttons.append([KeyboardButton(text="📞 Support")])
-    buttons.append([KeyboardButton(text="ℹ️ Yordam")])
-    return ReplyKeyboardMarkup(keyboard=buttons, resize_keyboard=True)
+        buttons.append([FrozenKeyboardButton(text="💳 Obuna sotib olish")])
+        buttons.append([FrozenKeyboardButton(text="📱 Telefon yuborish", request_contact=True)])
+    buttons.append([FrozenKeyboardButton(text="📞 Support")])
+    buttons.append([FrozenKeyboardButton(text="ℹ️ Yordam")])
+    return FrozenReplyKeyboardMarkup(keyboard=buttons, resize_keyboard=True)
 
+@lru_cache(maxsize=None)
 def admin_menu():
-    return ReplyKeyboardMarkup(
+    return FrozenReplyKeyboardMarkup(
         keyboard=[
-            [KeyboardButton(text="Statistika")],
-            [KeyboardButton(text="Excel Export")],
-            [KeyboardButton(text="Narxni o'zgartirish")],
-            [KeyboardButton(text="Aktiv qilish")],
-            [KeyboardButton(text="Aktiv emas qilish")],
-            [KeyboardButton(text="Chiqish")]
+            [FrozenKeyboardButton(text="Statistika")],
+            [FrozenKeyboardButton(text="Excel Export")],
+            [FrozenKeyboardButton(text="Narxni o'zgartirish")],
+            [FrozenKeyboardButton(text="Aktiv qilish")],
+            [FrozenKeyboardButton(text="Aktiv emas qilish")],
+            [FrozenKeyboardButton(text="Chiqish")]
         ],
         resize_keyboard=True
     )
 
 def channel_link_keyboard():
-    return InlineKeyboardMarkup(
-        inline_keyboard=[[InlineKeyboardButton(text="🔗 Kanalga kirish", url=config.CHANNEL_INVITE_LINK)]]
+    return _channel_link_keyboard(config.CHANNEL_INVITE_LINK)
+
+@lru_cache(maxsize=4)
+def _channel_link_keyboard(invite_link):
+    return FrozenInlineKeyboardMarkup(
+        inline_keyboard=[[FrozenInlineKeyboardButton(text="🔗 Kanalga kirish", url=invite_link)]]
     )
 
+# ================= TEMPLATES =================
+# Static message parts are rendered once per price / config value; handlers
+# only fill in per-user fields.
+STATUS_TEXT = {
+    "active": "Aktiv",
+    "inactive": "Aktiv emas",
+    "expired": "Tugagan",
+    "banned": "Bloklangan"
+}
+
+START_ACTIVE_TEXT = (
+    "? <b>Xush kelibsiz, {fullname}!</b>"
+    "?? <b>Obuna ma'lumotlari:</b>"
+    "? Status: ? Aktiv"
+    "? Muddat: {expiry} gacha"
+    "? {days_left} kun qoldi"
+)
+
+HELP_TEXT = (
+    "ℹ️ <b>Yordam</b>\n\n"
+    "Botdan foydalanish:\n"
+    "1. /start - Botni ishga tushirish\n"
+    "2. Telefon raqamingizni yuboring\n"
+    "3. Obuna sotib olish\n"
+    "4. Chek fotosuratini yuboring\n"
+    "5. Admin tekshiradi va obunani faollashtiradi"
+)
+
+@lru_cache(maxsize=4)
+def start_inactive_text(price):
+    return (
+        f"?? <b>Obuna narxi:</b> {price:,} so'm / oy"
+        "?? Obuna bo'lish uchun:"
+        "1. Telefon raqamingizni yuboring"
+        "2. To'lovni amalga oshiring"
+        "3. Chek fotosuratini yuboring"
+    )
+
+@lru_cache(maxsize=4)
+def registered_text(price):
+    return (
+        f"?? Obuna narxi: {price:,} so'm\n"
+        "Telefon raqamingizni yuboring yoki obuna sotib olishni bosing."
+    )
+
+@lru_cache(maxsize=4)
+def contact_text(price):
+    return f"💰 To'lov: {price:,} so'm\n📸 Chek fotosuratini yuboring:"
+
+@lru_cache(maxsize=4)
+def buy_text(price):
+    return f"💰 Obuna narxi: {price:,} so'm\n📸 To'lov chekini yuboring:"
+
+@lru_cache(maxsize=4)
+def approved_text(sub_days):
+    return f"✅ To'lov tasdiqlandi! Obuna {sub_days} kun faollashtirildi."
+
 class Registration(StatesGroup):
     waiting_fullname = State()
 
@@ -207,23 +291,18 @@ async def start(message: Message, state: FSMContext):
         if expiry >= today_date():
             days_left = (expiry - today_date()).days
             await message.answer(
-                f"? <b>Xush kelibsiz, {current_fullname}!</b>"
-                f"?? <b>Obuna ma'lumotlari:</b>"
-                f"? Status: ? Aktiv"
-                f"? Muddat: {expiry.strftime('%d.%m.%Y')} gacha"
-                f"? {days_left} kun qoldi",
+                START_ACTIVE_TEXT.format(
+                    fullname=current_fullname,
+                    expiry=expiry.strftime('%d.%m.%Y'),
+                    days_left=days_left,
+                ),
                 reply_markup=main_menu(True),
             )
             await message.answer("?? <b>Kanalga kirish:</b>", reply_markup=channel_link_keyboard())
             return
 
     await message.answer(
-        f"?? <b>Xush kelibsiz, {current_fullname}!</b>"
-        f"?? <b>Obuna narxi:</b> {price:,} so'm / oy"
-        "?? Obuna bo'lish uchun:"
-"1. Telefon raqamingizni yuboring"
-"2. To'lovni amalga oshiring"
-"3. Chek fotosuratini yuboring",
+        f"?? <b>Xush kelibsiz, {current_fullname}!</b>" + start_inactive_text(price),
         reply_markup=main_menu(False),
     )
 
@@ -241,9 +320,7 @@ async def save_fullname(message: Message, state: FSMContext):
     await state.clear()
     price = await get_price()
     await message.answer(
-        f"? Ma'lumot saqlandi: {fullname}\n"
-        f"?? Obuna narxi: {price:,} so'm\n"
-        "Telefon raqamingizni yuboring yoki obuna sotib olishni bosing.",
+        f"? Ma'lumot saqlandi: {fullname}\n" + registered_text(price),
         reply_markup=main_menu(False),
     )
 
@@ -259,7 +336,7 @@ async def handle_contact(message: Message):
         await db.execute("UPDATE users SET phone=? WHERE telegram_id=?", (phone, user_id))
         await db.commit()
     price = await get_price()
-    await message.answer(f"✅ Telefon raqam qabul qilindi!\n📱 {phone}\n💰 To'lov: {price:,} so'm\n📸 Chek fotosuratini yuboring:")
+    await message.answer(f"✅ Telefon raqam qabul qilindi!\n📱 {phone}\n" + contact_text(price))
 
 # ================= PROFILE =================
 @dp.message(F.text.contains("Profil"))
@@ -268,18 +345,12 @@ async def profile(message: Message):
     if not user:
         return await message.answer("Profil topilmadi. /start buyrug'ini yuboring.")
 
-    status_text = {
-        "active": "Aktiv",
-        "inactive": "Aktiv emas",
-        "expired": "Tugagan",
-        "banned": "Bloklangan"
-    }
     profile_text = (
         f"Shaxsiy profil\n\n"
         f"ID: {user['telegram_id']}\n"
         f"Ism: {user['fullname']}\n"
         f"Telefon: {user['phone'] or 'Yuborilmagan'}\n"
-        f'Status: {status_text.get(user["status"], "Nomalum")}\n'
+        f'Status: {STATUS_TEXT.get(user["status"], "Nomalum")}\n'
     )
     if user["expiry_date"]:
         expiry = datetime.strptime(user["expiry_date"], "%Y-%m-%d").date()
@@ -294,7 +365,7 @@ async def profile(message: Message):
 @dp.message(F.text.contains("Obuna sotib olish"))
 async def buy_subscription(message: Message):
     price = await get_price()
-    await message.answer(f"💰 Obuna narxi: {price:,} so'm\n📸 To'lov chekini yuboring:")
+    await message.answer(buy_text(price))
 
 # ================= CHANNEL LINK =================
 @dp.message(F.text.contains("Kanal linki"))
@@ -309,15 +380,7 @@ async def support(message: Message):
 # ================= HELP =================
 @dp.message(F.text.contains("Yordam"))
 async def help(message: Message):
-    await message.answer(
-        "ℹ️ <b>Yordam</b>\n\n"
-        "Botdan foydalanish:\n"
-        "1. /start - Botni ishga tushirish\n"
-        "2. Telefon raqamingizni yuboring\n"
-        "3. Obuna sotib olish\n"
-        "4. Chek fotosuratini yuboring\n"
-        "5. Admin tekshiradi va obunani faollashtiradi"
-    )
+    await message.answer(HELP_TEXT)
 
 # ================= PAYMENT PHOTO =================
 @dp.message(F.photo)
@@ -477,7 +540,7 @@ async def approve_payment(callback: CallbackQuery):
         await db.execute("UPDATE payments SET status='approved' WHERE id=?", (payment_id,))
         await db.commit()
     await callback.answer("✅ To'lov tasdiqlandi")
-    await bot.send_message(user_id, f"✅ To'lov tasdiqlandi! Obuna {config.SUB_DAYS} kun faollashtirildi.")
+    await bot.send_message(user_id, approved_text(config.SUB_DAYS))
     await bot.send_message(user_id, "Kanalga kirish:", reply_markup=channel_link_keyboard())
     await callback.message.delete()
 